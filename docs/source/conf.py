@@ -119,6 +119,23 @@ copybutton_prompt_text = r">>> |\.\.\. "
 copybutton_prompt_is_regexp = True
 
 
+_CLASSPATH_RE = re.compile(
+    r"""
+    ~?
+    (
+      (?:pl|
+        (?:polars\.
+          (?:_reexport|datatypes)
+        )
+      )
+      (?:\.[a-z.]+)?\.
+      ([A-Z][\w.]+)
+    )
+    """,
+    re.VERBOSE,
+)
+
+
 def _minify_classpaths(s: str) -> str:
     # from polars:
     # strip private polars classpaths, leaving the classname:
@@ -127,24 +144,9 @@ def _minify_classpaths(s: str) -> str:
     # * "polars.lazyframe.frame.LazyFrame" -> "LazyFrame"
     # also:
     # * "datetime.date" => "date"
-    s = s.replace("datetime.", "")
-    return re.sub(
-        pattern=r"""
-        ~?
-        (
-          (?:pl|
-            (?:polars\.
-              (?:_reexport|datatypes)
-            )
-          )
-          (?:\.[a-z.]+)?\.
-          ([A-Z][\w.]+)
-        )
-        """,
-        repl=r"\2",
-        string=s,
-        flags=re.VERBOSE,
-    )
+    if "pl" not in s and "polars" not in s and "datetime." not in s:
+        return s
+    return _CLASSPATH_RE.sub(r"\2", s.replace("datetime.", ""))
 
 
 # # sphinx-ext-linkcode - Add external links to source code
@@ -205,11 +207,15 @@ def _minify_classpaths(s: str) -> str:
 #     return f"{github_root}/blob/{git_ref}/py-polars/polars/{fn}{linespec}"
 
 
+def _maybe_minify(s: str | None) -> str | None:
+    # most signatures contain nothing to rewrite; skip the regex for them
+    if not s or ("pl" not in s and "polars" not in s and "datetime." not in s):
+        return s
+    return _minify_classpaths(s)
+
+
 def process_signature(app, what, name, obj, opts, sig, ret):
-    return (
-        _minify_classpaths(sig) if sig else sig,
-        _minify_classpaths(ret) if ret else ret,
-    )
+    return (_maybe_minify(sig), _maybe_minify(ret))
 
 
 def setup(app):
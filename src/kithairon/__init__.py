@@ -1,12 +1,30 @@
 """A library for working with the Echo liquid handler."""
 
 import importlib.util
+from typing import TYPE_CHECKING, Any
 
+from . import surveys as surveys
+from ._xml import prebuild_schemas
 from .labware import Labware, PlateInfo
-from .picklists import PickList
-from .surveys import SurveyData
+
+if TYPE_CHECKING:
+    from .picklists import PickList
+    from .surveys import SurveyData
 
 if importlib.util.find_spec("kithairon_extra"):
     from kithairon_extra import *  # noqa
 
-__all__ = ["SurveyData", "PickList", "Labware", "PlateInfo"]
+__all__ = ["SurveyData", "PickList", "Labware", "PlateInfo", "prebuild_schemas"]
+
+
+def __getattr__(name: str) -> Any:
+    # PickList and SurveyData import polars, so load them on first use.
+    if name == "PickList":
+        from .picklists import PickList
+
+        return PickList
+    if name == "SurveyData":
+        from .surveys import SurveyData
+
+        return SurveyData
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,65 @@
+"""Base class for pydantic-xml models with deferred schema building."""
+
+import typing
+from typing import Any
+
+from lxml import etree
+from pydantic import ConfigDict
+from pydantic_xml import BaseXmlModel
+
+try:
+    from typing import Self
+except ImportError:
+    from typing_extensions import Self
+
+_DEFERRED_MODELS: list[type["DeferredXmlModel"]] = []
+_FULLY_BUILT: set[type["DeferredXmlModel"]] = set()
+
+
+def _nested_models(annotation: Any) -> list[type["DeferredXmlModel"]]:
+    if isinstance(annotation, type) and issubclass(annotation, DeferredXmlModel):
+        return [annotation]
+    return [m for arg in typing.get_args(annotation) for m in _nested_models(arg)]
+
+
+def _build(model: type["DeferredXmlModel"]) -> None:
+    # A model may already have been built by pydantic on instantiation, without
+    # its nested models, so track which models have been built recursively.
+    if model in _FULLY_BUILT:
+        return
+    if model.__xml_serializer__ is None:
+        model.model_rebuild()
+    _FULLY_BUILT.add(model)
+    for field in model.model_fields.values():
+        for nested in _nested_models(field.annotation):
+            _build(nested)
+
+
+class DeferredXmlModel(BaseXmlModel):
+    """A pydantic-xml model whose schema and serializer are built on first use.
+
+    pydantic-xml does not build deferred models (or the deferred models nested
+    inside them) when they are first used for XML, so the XML entry points here
+    build the model and everything it contains before deferring to pydantic-xml.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _DEFERRED_MODELS.append(cls)
+
+    @classmethod
+    def from_xml_tree(cls, root: etree._Element, *args: Any, **kwargs: Any) -> Self:  # type: ignore[override]
+        _build(cls)
+        return super().from_xml_tree(root, *args, **kwargs)
+
+    def to_xml_tree(self, *args: Any, **kwargs: Any) -> etree._Element:  # type: ignore[override]
+        _build(type(self))
+        return super().to_xml_tree(*args, **kwargs)
+
+
+def prebuild_schemas() -> None:
+    """Build the schemas of all of kithairon's XML models now, rather than on first use."""
+    for model in _DEFERRED_MODELS:
+        _build(model)
@@ -1,15 +1,23 @@
 """Labware definition file support."""
 
+import functools
+import io
 import logging
 import os
 import typing
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from typing_extensions import Self
 
-import polars as pl
+import lxml.etree as ET
 import xdg_base_dirs
-from pydantic_xml import BaseXmlModel, attr
+from pydantic import model_validator
+from pydantic_xml import attr
+
+from ._xml import DeferredXmlModel
+
+if TYPE_CHECKING:
+    import polars as pl
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +46,7 @@ _CONSISTENT_COLS = [
 ]
 
 
-class PlateInfo(BaseXmlModel, tag="plateinfo"):
+class PlateInfo(DeferredXmlModel, tag="plateinfo"):
     """Plate type information."""
 
     plate_type: str = attr(
@@ -108,102 +116,87 @@ class PlateInfo(BaseXmlModel, tag="plateinfo"):
         return (self.rows, self.cols)
 
 
-_PLATE_INFO_SCHEMA = {
-    k: cast(
-        type,
-        v.annotation
-        if not (type_union := typing.get_args(v.annotation))
-        else type_union[0],
-    )
-    for k, v in PlateInfo.model_fields.items()
-}
-
-
-class _PlateInfoELWDest(PlateInfo):
-    @property
-    def usage(self) -> str:
-        return "DEST"
-
-    @usage.setter
-    def usage(self, value: str) -> None:
-        raise ValueError("Cannot set usage in ELW (ELWX-specific)")
-
-    @property
-    def well_length(self) -> int:
-        return self.well_width
-
-    @well_length.setter
-    def well_length(self, value: str) -> None:
-        raise ValueError("Cannot set well_length in ELW (ELWX-specific)")
-
-    @property
-    def plate_format(self) -> str:
-        return "UNKNOWN"
+@functools.cache
+def _plate_info_schema() -> dict[str, type]:
+    return {
+        k: cast(
+            type,
+            v.annotation
+            if not (type_union := typing.get_args(v.annotation))
+            else type_union[0],
+        )
+        for k, v in PlateInfo.model_fields.items()
+    }
 
-    @plate_format.setter
-    def plate_format(self, value: str) -> None:
-        raise ValueError("Cannot set plate_format in ELW (ELWX-specific)")
 
+class _PlateInfoELW(PlateInfo):
+    plate_format: str = attr(name="plateformat", default="UNKNOWN")
 
-class _PlateInfoELWSrc(PlateInfo):
-    @property
-    def usage(self) -> str:
-        return "SRC"
+    @model_validator(mode="before")
+    @classmethod
+    def _well_length_from_width(cls, data: Any) -> Any:
+        # ELW files have no welllength attribute; wells are taken to be square.
+        if isinstance(data, dict) and data.get("well_length") is None:
+            data = data | {"well_length": data.get("well_width")}
+        return data
 
-    @usage.setter
-    def usage(self, value: str) -> None:
-        raise ValueError("Cannot set usage in ELW (ELWX-specific)")
 
-    @property
-    def well_length(self) -> int:
-        return self.well_width
+class _PlateInfoELWDest(_PlateInfoELW):
+    usage: str = attr(name="usage", default="DEST")
 
-    @well_length.setter
-    def well_length(self, value: str) -> None:
-        raise ValueError("Cannot set well_length in ELW (ELWX-specific)")
 
-    @property
-    def plate_format(self) -> str:
-        return "UNKNOWN"
+class _PlateInfoELWSrc(_PlateInfoELW):
+    usage: str = attr(name="usage", default="SRC")
 
-    @plate_format.setter
-    def plate_format(self, value: str) -> None:
-        raise ValueError("Cannot set plate_format in ELW (ELWX-specific)")
 
-
-class _SourcePlateListELWX(BaseXmlModel, tag="sourceplates"):
+class _SourcePlateListELWX(DeferredXmlModel, tag="sourceplates"):
     plates: list[PlateInfo]
 
 
-class _DestinationPlateListELWX(BaseXmlModel, tag="destinationplates"):
+class _DestinationPlateListELWX(DeferredXmlModel, tag="destinationplates"):
     plates: list[PlateInfo]
 
 
-class _SourcePlateListELW(BaseXmlModel, tag="sourceplates"):
+class _SourcePlateListELW(DeferredXmlModel, tag="sourceplates"):
     plates: list[_PlateInfoELWSrc]
 
 
-class _DestinationPlateListELW(BaseXmlModel, tag="destinationplates"):
+class _DestinationPlateListELW(DeferredXmlModel, tag="destinationplates"):
     plates: list[_PlateInfoELWDest]
 
 
-class EchoLabwareELWX(BaseXmlModel, tag="EchoLabware"):
+class EchoLabwareELWX(DeferredXmlModel, tag="EchoLabware"):
     source_plates: _SourcePlateListELWX
     destination_plates: _DestinationPlateListELWX
 
 
-class EchoLabwareELW(BaseXmlModel, tag="EchoLabware"):
+class EchoLabwareELW(DeferredXmlModel, tag="EchoLabware"):
     source_plates: _SourcePlateListELW
     destination_plates: _DestinationPlateListELW
 
 
+def _looks_like_elwx(xml: bytes) -> bool:
+    """Check whether labware XML is ELWX, from the first `plateinfo` element only.
+
+    ELWX plate entries carry a `usage` attribute; ELW ones do not, and instead
+    rely on being under `sourceplates` or `destinationplates`.
+    """
+    for _, plate in ET.iterparse(
+        io.BytesIO(xml), tag="plateinfo", resolve_entities=False
+    ):
+        return "usage" in plate.attrib
+    return True
+
+
 class Labware:
     """A collection of plate type information."""
 
-    _plates: list[PlateInfo]
+    _plates: dict[str, PlateInfo]
 
     def __init__(self, plates: list[PlateInfo]):
-        self._plates = plates
+        self._plates = {}
+        for plate in plates:
+            self.add(plate)
 
     @classmethod
     def from_raw(cls, raw: EchoLabwareELWX | EchoLabwareELW) -> Self:
@@ -214,12 +207,10 @@ class Labware:
 
     @classmethod
     def from_file(cls, path: str | os.PathLike[str]) -> Self:
-        with Path(path).open("rb") as p:
-            xml_string = p.read()
-        try:
+        xml_string = Path(path).read_bytes()
+        if _looks_like_elwx(xml_string):
             return cls.from_raw(EchoLabwareELWX.from_xml(xml_string))
-        except Exception:
-            return cls.from_raw(EchoLabwareELW.from_xml(xml_string))
+        return cls.from_raw(EchoLabwareELW.from_xml(xml_string))
 
     def to_file(self, path: str | os.PathLike[str], **kwargs: dict[str, Any]) -> None:
         """Write an ELWX labware file.
@@ -230,14 +221,9 @@ class Labware:
             path to write to
         """
         xml_string = self.to_xml(**kwargs)
-        path = Path(path)
-        match xml_string:
-            case str():
-                with path.open("w") as f:
-                    f.write(xml_string)
-            case bytes():
-                with path.open("wb") as f:
-                    f.write(xml_string)
+        if isinstance(xml_string, str):
+            xml_string = xml_string.encode("utf-8")
+        Path(path).write_bytes(xml_string)
 
     def to_xml(self, **kwargs: dict[str, Any]) -> str | bytes:
         """Generate an ELWX XML string.
@@ -254,32 +240,39 @@ class Labware:
         """
         return self.to_elwx().to_xml(**({"skip_empty": True} | kwargs))
 
-    def to_polars(self) -> pl.DataFrame:
-        return pl.from_records(self._plates, schema=_PLATE_INFO_SCHEMA)
+    def to_polars(self) -> "pl.DataFrame":
+        import polars as pl
+
+        schema = _plate_info_schema()
+        columns = {
+            k: [getattr(plate, k) for plate in self._plates.values()] for k in schema
+        }
+        return pl.DataFrame(columns, schema=schema)
 
     def to_elwx(self) -> EchoLabwareELWX:
+        source_plates: list[PlateInfo] = []
+        destination_plates: list[PlateInfo] = []
+        for plate in self._plates.values():
+            usage = plate.usage
+            if usage == "SRC":
+                source_plates.append(plate)
+            elif usage == "DEST":
+                destination_plates.append(plate)
         return EchoLabwareELWX(
-            source_plates=_SourcePlateListELWX(
-                plates=[plate for plate in self._plates if plate.usage == "SRC"]
-            ),
-            destination_plates=_DestinationPlateListELWX(
-                plates=[plate for plate in self._plates if plate.usage == "DEST"]
-            ),
+            source_plates=_SourcePlateListELWX(plates=source_plates),
+            destination_plates=_DestinationPlateListELWX(plates=destination_plates),
         )
 
     def __getitem__(self, plate_type: str) -> PlateInfo:
-        for plate in self._plates:
-            if plate.plate_type == plate_type:
-                return plate
-        raise KeyError(plate_type)
+        return self._plates[plate_type]
 
     def keys(self) -> list[str]:
-        return [plate.plate_type for plate in self._plates]
+        return list(self._plates)
 
     def add(self, plate: PlateInfo) -> None:
-        if plate.plate_type in self.keys():
+        if plate.plate_type in self._plates:
             raise KeyError(f"Plate of type {plate.plate_type} already exists.")
-        self._plates.append(plate)
+        self._plates[plate.plate_type] = plate
 
     def make_default(self) -> None:
         global DEFAULT_LABWARE  # noqa
@@ -1,7 +1,20 @@
 """Kithairon and Echo survey formats."""
 
+from typing import TYPE_CHECKING, Any
+
 from .platesurvey import EchoPlateSurveyXML
-from .surveydata import SurveyData
 from .surveyreport import EchoSurveyReport
 
+if TYPE_CHECKING:
+    from .surveydata import SurveyData
+
 __all__ = ["SurveyData", "EchoPlateSurveyXML", "EchoSurveyReport"]
+
+
+def __getattr__(name: str) -> Any:
+    # SurveyData imports polars, so load it on first use.
+    if name == "SurveyData":
+        from .surveydata import SurveyData
+
+        return SurveyData
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,16 @@
 """Model for platesurvey XML file format."""
 
+import functools
+import hashlib
+import importlib.metadata
 import os
-from collections.abc import Callable
+import pickle
+import tempfile
+import typing
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any, cast
 
 try:
@@ -13,33 +21,63 @@ except ImportError:
 import logging
 
 import lxml.etree as ET
-import polars as pl
-from pydantic import BeforeValidator, NonNegativeInt, PlainSerializer, model_validator
-from pydantic_xml import BaseXmlModel, attr
+import xdg_base_dirs
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    NonNegativeInt,
+    PlainSerializer,
+    model_validator,
+)
+from pydantic_xml import ParsingError, attr
+
+from kithairon._xml import DeferredXmlModel
 
 if TYPE_CHECKING:
+    import polars as pl
+
     from .surveydata import SurveyData
 
-_PARSER = ET.XMLParser(resolve_entities=False)
+_PARSER_OPTIONS: dict[str, Any] = {
+    "remove_blank_text": True,
+    "collect_ids": False,
+    "huge_tree": True,
+    "resolve_entities": False,
+}
+_PARSER = ET.XMLParser(**_PARSER_OPTIONS)
 logger = logging.getLogger(__name__)
 
+
+def _barcode_validate(val: Any) -> Any:
+    return val if val != "UnknownBarCode" else None
+
+
+def _barcode_serialize(val: str | None) -> str:
+    return val if val is not None else "UnknownBarCode"
+
+
+def _float_null_zero_validate(val: Any) -> Any:
+    return val if val != 0 else None
+
+
+def _float_null_zero_serialize(val: float | None) -> float:
+    return val if val is not None else 0
+
+
 Barcode = Annotated[
     str | None,
-    PlainSerializer(
-        lambda val: val if val is not None else "UnknownBarCode",
-        when_used="unless-none",
-    ),
-    BeforeValidator(lambda val: val if val != "UnknownBarCode" else None),
+    PlainSerializer(_barcode_serialize, when_used="unless-none"),
+    BeforeValidator(_barcode_validate),
 ]
 
 FloatNullZero = Annotated[
     float | None,
-    BeforeValidator(lambda val: val if val != 0 else None),
-    PlainSerializer(lambda val: val if val is not None else 0, when_used="unless-none"),
+    BeforeValidator(_float_null_zero_validate),
+    PlainSerializer(_float_null_zero_serialize, when_used="unless-none"),
 ]
 
 
-class SignalFeature(BaseXmlModel, tag="f"):
+class SignalFeature(DeferredXmlModel, tag="f"):
     """Single feature of an echo signal.  `f` element."""
 
     feature_type: str = attr(name="t")
@@ -47,7 +85,7 @@ class SignalFeature(BaseXmlModel, tag="f"):
     vpp: float = attr(name="v")
 
 
-class EchoSignal(BaseXmlModel, tag="e"):
+class EchoSignal(DeferredXmlModel, tag="e"):
     """Echo signal information for a well.  `e` element."""
 
     signal_type: str = attr(name="t")
@@ -57,7 +95,7 @@ class EchoSignal(BaseXmlModel, tag="e"):
     features: list[SignalFeature]
 
 
-class WellSurvey(BaseXmlModel, tag="w"):
+class WellSurvey(DeferredXmlModel, tag="w"):
     """Survey information for a single well. `w` element."""
 
     row: NonNegativeInt = attr(name="r")
@@ -89,7 +127,132 @@ class WellSurvey(BaseXmlModel, tag="w"):
     echo_signal: EchoSignal
 
 
-class EchoPlateSurveyXML(BaseXmlModel, tag="platesurvey"):
+def _polars_dtype(annotation: Any) -> "pl.PolarsDataType":
+    """Polars dtype for a field annotation (scalar, optional, list, or model)."""
+    import polars as pl
+
+    args = typing.get_args(annotation)
+    if typing.get_origin(annotation) is list:
+        return pl.List(_polars_dtype(args[0]))
+    if args:
+        return _polars_dtype(next(a for a in args if a is not type(None)))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return pl.Struct(
+            {k: _polars_dtype(v.annotation) for k, v in annotation.model_fields.items()}
+        )
+    return {int: pl.Int64, float: pl.Float64, str: pl.Utf8}[annotation]
+
+
+@functools.cache
+def _well_schema() -> dict[str, "pl.PolarsDataType"]:
+    return {k: _polars_dtype(v.annotation) for k, v in WellSurvey.model_fields.items()}
+
+
+def _echo_signal_record(signal: EchoSignal) -> dict[str, Any]:
+    return {
+        "signal_type": signal.signal_type,
+        "transducer_x": signal.transducer_x,
+        "transducer_y": signal.transducer_y,
+        "transducer_z": signal.transducer_z,
+        "features": [
+            {"feature_type": f.feature_type, "tof": f.tof, "vpp": f.vpp}
+            for f in signal.features
+        ],
+    }
+
+
+def _wells_to_polars(wells: list[WellSurvey]) -> "pl.DataFrame":
+    """Build a DataFrame of wells column by column, without dumping each model."""
+    import polars as pl
+
+    schema = _well_schema()
+    columns = {k: [getattr(w, k) for w in wells] for k in schema}
+    columns["echo_signal"] = [_echo_signal_record(s) for s in columns["echo_signal"]]
+    return pl.DataFrame(columns, schema=schema)
+
+
+# (field name, XML attribute, conversion) for each WellSurvey attribute
+_WELL_ATTRIBUTES: list[tuple[str, str, Callable[[str], Any]]] = [
+    ("row", "r", int),
+    ("column", "c", int),
+    ("well", "n", str),
+    ("volume", "vl", float),
+    ("current_volume", "cvl", float),
+    ("status", "status", str),
+    ("fluid", "fld", str),
+    ("fluid_units", "fldu", str),
+    ("meniscus_x", "x", float),
+    ("meniscus_y", "y", float),
+    ("fluid_composition", "s", float),
+    ("dmso_homogeneous", "fsh", float),
+    ("dmso_inhomogeneous", "fsinh", float),
+    ("fluid_thickness", "t", float),
+    ("current_fluid_thickness", "ct", float),
+    ("bottom_thickness", "b", float),
+    ("fluid_thickness_homogeneous", "fth", float),
+    ("fluid_thickness_imhomogeneous", "ftinh", float),
+    ("outlier", "o", float),
+    ("corrective_action", "a", str),
+]
+
+
+# (field name, XML attribute) for each EchoPlateSurveyXML attribute
+_PLATESURVEY_ATTRIBUTES: list[tuple[str, str]] = [
+    ("plate_type", "name"),
+    ("plate_barcode", "barcode"),
+    ("timestamp", "date"),
+    ("instrument_serial_number", "serial_number"),
+    ("vtl", "vtl"),
+    ("original", "original"),
+    ("data_format_version", "frmt"),
+    ("survey_rows", "rows"),
+    ("survey_columns", "cols"),
+    ("survey_total_wells", "totalWells"),
+    ("plate_name", "plate_name"),
+    ("comment", "note"),
+]
+
+
+def _construct_well_survey(elem: ET._Element) -> WellSurvey:
+    """Build a WellSurvey from a `w` element without validation."""
+    attrib = elem.attrib
+    signal = elem.find("e")
+    assert signal is not None
+    features = [
+        SignalFeature.model_construct(
+            feature_type=f.get("t"), tof=float(f.get("o")), vpp=float(f.get("v"))
+        )
+        for f in signal.iterfind("f")
+    ]
+    return WellSurvey.model_construct(
+        **{field: conv(attrib[name]) for field, name, conv in _WELL_ATTRIBUTES},
+        echo_signal=EchoSignal.model_construct(
+            signal_type=signal.get("t"),
+            transducer_x=float(signal.get("x")),
+            transducer_y=float(signal.get("y")),
+            transducer_z=float(signal.get("z")),
+            features=features,
+        ),
+    )
+
+
+@functools.cache
+def _cache_versions() -> str:
+    """Versions of kithairon, pydantic and pydantic-xml, for survey cache keys.
+
+    Packages without distribution metadata (eg, an uninstalled source checkout)
+    are recorded as "unknown".
+    """
+    versions = []
+    for package in ("kithairon", "pydantic", "pydantic-xml"):
+        try:
+            versions.append(importlib.metadata.version(package))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append("unknown")
+    return ":".join(versions)
+
+
+class EchoPlateSurveyXML(DeferredXmlModel, tag="platesurvey"):
     """A platesurvey XML model for files generated by the Medman / 'Echo Liquid Handler' software."""
 
     plate_type: str = attr(name="name")
@@ -121,17 +284,12 @@ class EchoPlateSurveyXML(BaseXmlModel, tag="platesurvey"):
     """Comment.  Additional attribute, added by kithairon."""
 
     @model_validator(mode="after")
-    def check_number_of_wells(self) -> Self:
-        """Check that the number of wells matches the number of rows and columns."""
+    def check_survey(self) -> Self:
+        """Check that the number of wells matches the reported total, and warn if the data format version is not 1."""
         if len(self.wells) != self.survey_total_wells:
             raise ValueError(
                 f"Number of well data items ({len(self.wells)}) does not match reported ({self.survey_total_wells})"
             )
-        return self
-
-    @model_validator(mode="after")
-    def check_data_format_version(self) -> Self:
-        """Ensure that the data format version is 1."""
         if self.data_format_version != 1:
             logger.warning(
                 "Unexpected data format version %s."
@@ -148,7 +306,163 @@ class EchoPlateSurveyXML(BaseXmlModel, tag="platesurvey"):
         -------
         EchoPlateSurveyXML
         """
-        return cls.from_xml_tree(ET.parse(path, parser=_PARSER).getroot())
+        return cls.from_xml_tree(ET.parse(os.fspath(path), parser=_PARSER).getroot())
+
+    @classmethod
+    def read_xml_cached(
+        cls, path: os.PathLike | str, cache_dir: os.PathLike | str | None = None
+    ) -> Self:
+        """Read a platesurvey XML file, caching the parsed survey on disk.
+
+        The cache is keyed on the file's absolute path, modification time and size,
+        and the kithairon, pydantic and pydantic-xml versions, so a changed file or
+        upgraded library is reparsed.  Unreadable cache entries are reparsed and
+        overwritten, and failures to write the cache are logged and ignored.
+
+        Parameters
+        ----------
+        path : os.PathLike | str
+            The path to read.
+        cache_dir : os.PathLike | str | None
+            Directory for cached surveys.  Defaults to `kithairon/platesurveys` in
+            the XDG cache directory.
+
+        Returns
+        -------
+        EchoPlateSurveyXML
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        cache_dir = (
+            Path(cache_dir)
+            if cache_dir is not None
+            else xdg_base_dirs.xdg_cache_home() / "kithairon" / "platesurveys"
+        )
+        key = hashlib.blake2b(
+            f"{path}:{stat.st_mtime_ns}:{stat.st_size}:{_cache_versions()}".encode()
+        ).hexdigest()
+        cache_path = cache_dir / f"{key}.pkl"
+
+        if cache_path.exists():
+            try:
+                survey = pickle.loads(cache_path.read_bytes())
+            except Exception:
+                logger.warning(
+                    "Could not load cached survey %s; reparsing.",
+                    cache_path,
+                    exc_info=True,
+                )
+            else:
+                if isinstance(survey, cls):
+                    return survey
+                logger.warning(
+                    "Cached survey %s is not a %s; reparsing.", cache_path, cls.__name__
+                )
+
+        survey = cls.read_xml(path)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as f:
+                tmp_path = Path(f.name)
+            try:
+                tmp_path.write_bytes(pickle.dumps(survey, protocol=5))
+                tmp_path.replace(cache_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+        except OSError:
+            logger.warning(
+                "Could not write cached survey %s.", cache_path, exc_info=True
+            )
+        return survey
+
+    @classmethod
+    def read_xml_many(
+        cls,
+        paths: Iterable[os.PathLike | str],
+        max_workers: int | None = None,
+    ) -> list[Self]:
+        """Read many platesurvey XML files in parallel, using a process pool.
+
+        Parameters
+        ----------
+        paths : Iterable[os.PathLike | str]
+            Paths to read.
+        max_workers : int | None
+            Maximum number of worker processes.  Defaults to the number of CPUs.
+
+        Returns
+        -------
+        list[EchoPlateSurveyXML]
+            Surveys, in the same order as `paths`.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls.read_xml, paths, chunksize=4))
+
+    @classmethod
+    def read_xml_streaming(cls, path: os.PathLike | str) -> Self:
+        """Read a platesurvey XML file, parsing one well at a time.
+
+        Equivalent to `read_xml`, but each `w` element is discarded as soon as it
+        has been parsed, so the full element tree is never held in memory alongside
+        the parsed wells.
+
+        Returns
+        -------
+        EchoPlateSurveyXML
+        """
+        return cls._read_xml_by_well(path, WellSurvey.from_xml_tree)
+
+    @classmethod
+    def read_xml_trusted(cls, path: os.PathLike | str) -> Self:
+        """Read a platesurvey XML file without validating individual wells.
+
+        Wells, signals and features are built with `model_construct` directly from
+        the XML attributes, skipping pydantic validation.  Only use this for files
+        known to be well-formed platesurveys (eg, written by the Echo software):
+        malformed well data will not be caught, and may result in incorrect values.
+        Plate-level attributes are still validated.
+
+        Returns
+        -------
+        EchoPlateSurveyXML
+        """
+        return cls._read_xml_by_well(path, _construct_well_survey)
+
+    @classmethod
+    def _read_xml_by_well(
+        cls,
+        path: os.PathLike | str,
+        parse_well: Callable[[ET._Element], WellSurvey],
+    ) -> Self:
+        root = None
+        wells: list[WellSurvey] = []
+        for event, elem in ET.iterparse(
+            os.fspath(path), events=("start", "end"), **_PARSER_OPTIONS
+        ):
+            if event == "start":
+                if root is None:
+                    root = elem
+            elif elem.tag == "w" and elem.getparent() is root:
+                wells.append(parse_well(elem))
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del root[0]
+        assert root is not None
+        if root.tag != cls.__xml_tag__:
+            raise ParsingError(
+                f"root element not found (actual: {root.tag}, expected: {cls.__xml_tag__})"
+            )
+        # Wells are already parsed, so validate the plate attributes together with
+        # them; WellSurvey instances are not revalidated.
+        return cls.model_validate(
+            {
+                field: root.attrib[name]
+                for field, name in _PLATESURVEY_ATTRIBUTES
+                if name in root.attrib
+            }
+            | {"wells": wells}
+        )
 
     def write_xml(
         self,
@@ -179,11 +493,15 @@ class EchoPlateSurveyXML(BaseXmlModel, tag="platesurvey"):
         ET.ElementTree(self.to_xml_tree()).write(path, **kwargs)
         return path
 
-    def _to_polars(self) -> pl.DataFrame:
-        md = self.model_dump()
-        wells = md.pop("wells")
-        return pl.from_records(wells).with_columns(
-            **{k: pl.lit(v) for k, v in md.items()}
+    def _to_polars(self) -> "pl.DataFrame":
+        import polars as pl
+
+        return _wells_to_polars(self.wells).with_columns(
+            **{
+                k: pl.lit(getattr(self, k))
+                for k in type(self).model_fields
+                if k != "wells"
+            }
         )
 
     def to_surveydata(self) -> "SurveyData":
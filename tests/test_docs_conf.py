@@ -0,0 +1,42 @@
+import ast
+import re
+from pathlib import Path
+
+import pytest
+
+_CONF = Path(__file__).parent.parent / "docs" / "source" / "conf.py"
+
+
+@pytest.fixture(scope="module")
+def maybe_minify():
+    # conf.py imports Sphinx extensions at module level, so only compile the
+    # classpath-minifying definitions.
+    tree = ast.parse(_CONF.read_text())
+    wanted = {"_CLASSPATH_RE", "_minify_classpaths", "_maybe_minify"}
+    tree.body = [
+        node
+        for node in tree.body
+        if (isinstance(node, ast.FunctionDef) and node.name in wanted)
+        or (
+            isinstance(node, ast.Assign)
+            and any(getattr(t, "id", None) in wanted for t in node.targets)
+        )
+    ]
+    namespace = {"re": re}
+    exec(compile(tree, str(_CONF), "exec"), namespace)
+    return namespace["_maybe_minify"]
+
+
+@pytest.mark.parametrize(
+    ("sig", "expected"),
+    [
+        ("x: polars.datatypes.classes.Int64", "x: Int64"),
+        ("-> polars.datatypes.Float64", "-> Float64"),
+        ("(df: pl.DataFrame, d: datetime.date)", "(df: DataFrame, d: date)"),
+        ("(x: int) -> str", "(x: int) -> str"),
+        ("", ""),
+        (None, None),
+    ],
+)
+def test_maybe_minify(maybe_minify, sig, expected):
+    assert maybe_minify(sig) == expected
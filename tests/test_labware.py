@@ -0,0 +1,72 @@
+import pytest
+
+from kithairon import Labware, PlateInfo
+
+
+@pytest.fixture()
+def labware_elwx() -> Labware:
+    return Labware.from_file("tests/test_data/Labware.elwx")
+
+
+def test_getitem_and_keys(labware_elwx: Labware):
+    keys = labware_elwx.keys()
+    assert keys == [plate.plate_type for plate in labware_elwx._plates.values()]
+    for key in keys:
+        assert labware_elwx[key].plate_type == key
+    with pytest.raises(KeyError):
+        labware_elwx["not_a_plate_type"]
+
+
+def test_add(labware_elwx: Labware):
+    plate = labware_elwx[labware_elwx.keys()[0]]
+    with pytest.raises(KeyError):
+        labware_elwx.add(plate)
+
+    new_plate = plate.model_copy(update={"plate_type": "new_plate_type"})
+    labware_elwx.add(new_plate)
+    assert labware_elwx["new_plate_type"] is new_plate
+    assert labware_elwx.keys()[-1] == "new_plate_type"
+
+
+def test_from_file_detects_format():
+    from kithairon.labware import _PlateInfoELWDest, _PlateInfoELWSrc
+
+    elw = Labware.from_file("tests/test_data/Labware.elw")
+    assert any(isinstance(p, _PlateInfoELWSrc) for p in elw._plates.values())
+    assert any(isinstance(p, _PlateInfoELWDest) for p in elw._plates.values())
+
+    elwx = Labware.from_file("tests/test_data/Labware.elwx")
+    assert all(type(p) is PlateInfo for p in elwx._plates.values())
+
+
+def test_to_file_roundtrip(labware_elwx: Labware, tmp_path):
+    path = tmp_path / "labware.elwx"
+    labware_elwx.to_file(path)
+    assert Labware.from_file(path).keys() == labware_elwx.keys()
+
+    labware_elwx.to_file(path, encoding="unicode")
+    assert Labware.from_file(path).keys() == labware_elwx.keys()
+
+
+def test_elw_plate_defaults(tmp_path):
+    elw = Labware.from_file("tests/test_data/Labware.elw")
+    for plate in elw._plates.values():
+        assert plate.usage in ("SRC", "DEST")
+        assert plate.plate_format == "UNKNOWN"
+        assert plate.well_length == plate.well_width
+
+    elwx = elw.to_elwx()
+    assert len(elwx.source_plates.plates) + len(elwx.destination_plates.plates) == len(
+        elw.keys()
+    )
+    assert elw.to_polars().height == len(elw.keys())
+
+    path = tmp_path / "labware.elwx"
+    elw.to_file(path)
+    assert Labware.from_file(path).to_polars().equals(elw.to_polars())
+
+
+def test_init_rejects_duplicate_plate_types(labware_elwx: Labware):
+    plate = labware_elwx[labware_elwx.keys()[0]]
+    with pytest.raises(KeyError):
+        Labware([plate, plate.model_copy()])
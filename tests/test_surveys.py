@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import cast
 
 import numpy as np
@@ -6,6 +7,7 @@ import pytest
 from numpy.testing import assert_almost_equal, assert_array_almost_equal
 
 from kithairon import Labware, SurveyData
+from kithairon.surveys import EchoPlateSurveyXML
 
 
 @pytest.fixture(scope="module")
@@ -74,3 +76,96 @@ def test_extensions(platesurvey: SurveyData):
     dat = empty.extend(platesurvey.with_plate_name("A"))
 
     dat = dat.extend(platesurvey.with_plate_name("B"))
+
+
+def test_platesurvey_read_xml_streaming():
+    path = "tests/test_data/platesurvey.xml"
+    assert EchoPlateSurveyXML.read_xml_streaming(path) == EchoPlateSurveyXML.read_xml(
+        path
+    )
+
+
+def test_platesurvey_read_xml_trusted():
+    path = "tests/test_data/platesurvey.xml"
+    assert EchoPlateSurveyXML.read_xml_trusted(path) == EchoPlateSurveyXML.read_xml(
+        path
+    )
+
+
+def test_platesurvey_read_xml_many():
+    path = "tests/test_data/platesurvey.xml"
+    surveys = EchoPlateSurveyXML.read_xml_many([path, path], max_workers=2)
+    assert surveys == [EchoPlateSurveyXML.read_xml(path)] * 2
+
+
+def test_platesurvey_read_xml_cached(tmp_path):
+    path = "tests/test_data/platesurvey.xml"
+    first = EchoPlateSurveyXML.read_xml_cached(path, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+    second = EchoPlateSurveyXML.read_xml_cached(path, cache_dir=tmp_path)
+    assert first == second == EchoPlateSurveyXML.read_xml(path)
+
+
+def test_platesurvey_read_xml_cached_corrupt(tmp_path):
+    path = "tests/test_data/platesurvey.xml"
+    EchoPlateSurveyXML.read_xml_cached(path, cache_dir=tmp_path)
+    (cache_file,) = tmp_path.glob("*.pkl")
+    cache_file.write_bytes(b"not a pickle")
+
+    survey = EchoPlateSurveyXML.read_xml_cached(path, cache_dir=tmp_path)
+    assert survey == EchoPlateSurveyXML.read_xml(path)
+    assert cache_file.read_bytes() != b"not a pickle"
+
+
+def test_platesurvey_read_xml_cached_write_failure(tmp_path, monkeypatch):
+    path = "tests/test_data/platesurvey.xml"
+    expected = EchoPlateSurveyXML.read_xml(path)
+
+    def fail(*args, **kwargs):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(Path, "replace", fail)
+    assert EchoPlateSurveyXML.read_xml_cached(path, cache_dir=tmp_path) == expected
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_platesurvey_read_xml_cached_unusable_dir(tmp_path):
+    path = "tests/test_data/platesurvey.xml"
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_bytes(b"")
+
+    survey = EchoPlateSurveyXML.read_xml_cached(path, cache_dir=not_a_dir / "cache")
+    assert survey == EchoPlateSurveyXML.read_xml(path)
+    assert list(tmp_path.iterdir()) == [not_a_dir]
+
+
+def test_platesurvey_streaming_all_attributes(tmp_path):
+    from pydantic_xml import ParsingError
+
+    survey = EchoPlateSurveyXML.read_xml("tests/test_data/platesurvey.xml")
+    survey = survey.model_copy(
+        update={"plate_barcode": "BC1", "plate_name": "P", "comment": "C"}
+    )
+    path = tmp_path / "platesurvey.xml"
+    survey.write_xml(path, path_str_format=False)
+    assert EchoPlateSurveyXML.read_xml_streaming(path) == survey
+    assert EchoPlateSurveyXML.read_xml_trusted(path) == survey
+
+    with pytest.raises(ParsingError):
+        EchoPlateSurveyXML.read_xml_streaming("tests/test_data/surveyreport-cp.xml")
+
+
+def test_platesurvey_cache_versions_uninstalled(monkeypatch):
+    import importlib.metadata
+
+    from kithairon.surveys import platesurvey
+
+    def version(package):
+        raise importlib.metadata.PackageNotFoundError(package)
+
+    monkeypatch.setattr(importlib.metadata, "version", version)
+    platesurvey._cache_versions.cache_clear()
+    try:
+        assert platesurvey._cache_versions() == "unknown:unknown:unknown"
+    finally:
+        platesurvey._cache_versions.cache_clear()
@@ -0,0 +1,75 @@
+import json
+import os
+import subprocess
+import sys
+
+from kithairon import Labware
+
+
+def _run_fresh(code: str, tmp_path, stdin: str = "") -> str:
+    """Run code in a fresh interpreter, so no XML models have been built yet."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=os.environ | {"XDG_DATA_HOME": str(tmp_path)},
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_schemas_deferred_until_prebuilt(tmp_path):
+    _run_fresh(
+        """
+import kithairon
+from kithairon._xml import _DEFERRED_MODELS
+
+assert _DEFERRED_MODELS
+assert all(model.__xml_serializer__ is None for model in _DEFERRED_MODELS)
+kithairon.prebuild_schemas()
+assert all(model.__xml_serializer__ is not None for model in _DEFERRED_MODELS)
+""",
+        tmp_path,
+    )
+
+
+def test_validate_then_to_xml_builds_nested(tmp_path):
+    elwx = Labware.from_file("tests/test_data/Labware.elwx").to_elwx()
+    out = _run_fresh(
+        """
+import json
+import sys
+
+from kithairon.labware import EchoLabwareELWX
+
+sys.stdout.write(
+    EchoLabwareELWX.model_validate(json.load(sys.stdin)).to_xml(encoding="unicode")
+)
+""",
+        tmp_path,
+        stdin=json.dumps(elwx.model_dump()),
+    )
+    assert out == elwx.to_xml(encoding="unicode")
+
+
+def test_polars_import_deferred(tmp_path):
+    _run_fresh(
+        """
+import sys
+
+import kithairon
+import kithairon.labware
+import kithairon.surveys.platesurvey
+
+assert "polars" not in sys.modules
+kithairon.prebuild_schemas()
+assert "polars" not in sys.modules
+
+from kithairon import PickList, SurveyData
+
+assert "polars" in sys.modules
+""",
+        tmp_path,
+    )